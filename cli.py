@@ -4,8 +4,9 @@ import logging
 import os
 import threading
 import uuid
-from typing import Optional
+from typing import List, Optional
 
+import grpc
 from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import BaseChatMessage, BaseMessage
 from autogen_agentchat.ui import Console
@@ -137,15 +138,60 @@ def parse_args():
 load_dotenv("/chatbot/.env", override=True)
 
 
+def _create_tracer_provider(endpoint: str, service_name: str) -> TracerProvider:
+    """Create a tracer provider that exports spans to the OTLP collector."""
+    exporter = OTLPSpanExporter(
+        endpoint=endpoint, insecure=True, compression=grpc.Compression.Gzip
+    )
+    provider = TracerProvider(
+        resource=Resource.create({ResourceAttributes.SERVICE_NAME: service_name})
+    )
+    # A workflow run emits spans in bursts, so export fewer, larger batches
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=8192,
+            max_export_batch_size=1024,
+            schedule_delay_millis=2000,
+        )
+    )
+    return provider
+
+
+async def _read_input(prompt: str) -> str:
+    """Read a line from stdin on a daemon thread, so Ctrl-C never waits on it."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(result, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _read():
+        result, error = None, None
+        try:
+            result = input(prompt)
+        except BaseException as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(_resolve, result, error)
+        except RuntimeError:
+            # The loop already closed, nobody is waiting for this line any more
+            pass
+
+    threading.Thread(target=_read, name="cli-input", daemon=True).start()
+    return await future
+
+
 def setup_tracing(endpoint: str, service_name: str):
     """Setup OpenTelemetry tracing based on args."""
 
     try:
-        exporter = OTLPSpanExporter(endpoint=endpoint, insecure=True)
-        provider = TracerProvider(
-            resource=Resource.create({ResourceAttributes.SERVICE_NAME: service_name})
-        )
-        provider.add_span_processor(BatchSpanProcessor(exporter))
+        provider = _create_tracer_provider(endpoint, service_name)
         trace.set_tracer_provider(provider)
         tracer = trace.get_tracer(service_name)
         logging.info(f"OpenTelemetry tracing enabled, exporting to {endpoint}")
@@ -155,31 +201,39 @@ def setup_tracing(endpoint: str, service_name: str):
         return None
 
 
+_MISSING = object()
+
+
 def _default_to_text(self) -> str:
-    return getattr(self, "content", repr(self))
+    # Pydantic keeps field values in __dict__; only build the repr when needed
+    content = self.__dict__.get("content", _MISSING)
+    return content if content is not _MISSING else repr(self)
 
 
 BaseMessage.to_text = _default_to_text
 
 
-async def get_input_async():
-    # Get user input without blocking the event loop
-    loop = asyncio.get_event_loop()
-    future = (
-        loop.create_future()
-    )  # placeholder for the user input that will be available later
+class MemoryWriter:
+    """Persist chat memories in the background so the next prompt is not blocked."""
+
+    def __init__(self):
+        self._pending: Optional[asyncio.Task] = None
+
+    def schedule(self, memory: SagiMemory, contents: List[MemoryContent]) -> None:
+        # The main loop flushes before each turn, so at most one write is pending
+        self._pending = asyncio.create_task(self._write(memory, contents))
 
-    def _get_input():
+    @staticmethod
+    async def _write(memory: SagiMemory, contents: List[MemoryContent]) -> None:
         try:
-            result = input("User: ")
-            loop.call_soon_threadsafe(
-                future.set_result, result
-            )  # safely schedule the future result in the main loop (notify main loop)
+            await memory.add(contents)
         except Exception as e:
-            loop.call_soon_threadsafe(future.set_exception, e)
+            logging.error(f"Failed to save chat memory: {e}")
 
-    threading.Thread(target=_get_input, daemon=True).start()
-    return await future
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
 
 
 async def main_cmd(args: argparse.Namespace):
@@ -243,6 +297,11 @@ async def main_cmd(args: argparse.Namespace):
                 "max_tokens": 16000,
             }
         )
+        memory = SagiMemory(
+            chat_id=chat_id,
+            model_name=model,
+        )
+        memory.set_session_maker(session_maker)
     elif args.mode == "hirag":
         model = "gpt-4o-mini"
         model_name = get_model_name_by_api_provider(
@@ -276,20 +335,23 @@ async def main_cmd(args: argparse.Namespace):
         )
     )
 
+    memory_writer = MemoryWriter()
+
     try:
         while True:
-            user_input = await get_input_async()
+            # Read input off the loop so background tasks keep running
+            try:
+                user_input = await _read_input("User: ")
+            except EOFError:
+                break
             if user_input.lower() in ("quit", "exit", "q"):
                 break
 
+            # The next turn reads memories back, so the previous write must land first
+            await memory_writer.flush()
+
             chat_history: Optional[TaskResult] = None
             if args.mode == "multi_rounds":
-                memory = SagiMemory(
-                    chat_id=chat_id,
-                    model_name=model,
-                )
-                memory.set_session_maker(session_maker)
-
                 workflow = MultiRoundAgent(
                     model_client=model_client,
                     memory=memory,
@@ -306,15 +368,9 @@ async def main_cmd(args: argparse.Namespace):
                     )
                     for message in messages
                 ]
-                await memory.add(messages)
+                memory_writer.schedule(memory, messages)
 
             elif args.mode == "hirag":
-                memory = SagiMemory(
-                    chat_id=chat_id,
-                    model_name=model,
-                )
-                memory.set_session_maker(session_maker)
-
                 workflow = await RagSummaryAgent.create(
                     model_client=model_client,
                     memory=memory,
@@ -334,11 +390,9 @@ async def main_cmd(args: argparse.Namespace):
                     )
                     for message in messages
                 ]
-                await memory.add(messages)
+                memory_writer.schedule(memory, messages)
             else:
-                chat_history = await asyncio.create_task(
-                    Console(workflow.run_workflow(user_input))
-                )
+                chat_history = await Console(workflow.run_workflow(user_input))
                 await workflow.team.set_id_info("cli_dev", chat_id)
             if chat_history is not None:
                 print(
@@ -354,6 +408,9 @@ async def main_cmd(args: argparse.Namespace):
     except Exception as e:
         logging.error(f"Error: {e}")
     finally:
+        # Persist any memories still being written before tearing down the engine
+        await memory_writer.flush()
+
         # Cleanup session manager first (for hirag mode)
         if session_manager:
             try:
@@ -378,14 +435,27 @@ async def main_cmd(args: argparse.Namespace):
             logging.error(f"Error disposing database engine: {db_error}")
 
 
+def run_async(coro):
+    """Run the coroutine on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+
+
 if __name__ == "__main__":
     logging.info("------------- run main async---------------------------------------")
     args = parse_args()
-    if args.trace:
-        tracer = setup_tracing(
-            endpoint=args.trace_endpoint, service_name=args.trace_service_name
-        )
-        with tracer.start_as_current_span("runtime"):
-            asyncio.run(main_cmd(args))
-    else:
-        asyncio.run(main_cmd(args))
+    try:
+        if args.trace:
+            tracer = setup_tracing(
+                endpoint=args.trace_endpoint, service_name=args.trace_service_name
+            )
+            with tracer.start_as_current_span("runtime"):
+                run_async(main_cmd(args))
+        else:
+            run_async(main_cmd(args))
+    except KeyboardInterrupt:
+        # asyncio.run has already cancelled main_cmd and run its cleanup
+        logging.info("Interrupted, exiting.")
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 from typing import Optional
 
 from redis.asyncio import ConnectionPool, Redis
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
+from Sagi.utils.json_handler import json_dumps, json_loads
 from Sagi.utils.settings import settings
 
 
@@ -58,6 +60,9 @@ class PGSQLClient(SimpleSingleton):
             pool_recycle=3600,  # Recycle connections every hour
             pool_pre_ping=True,  # Verify connections before use
             echo=False,  # Set to True for SQL logging in development
+            # Let the driver (de)serialize JSON/JSONB columns with orjson
+            json_serializer=json_dumps,
+            json_deserializer=json_loads,
         )
 
         self._pgsql_session_maker = async_sessionmaker(
@@ -92,6 +97,7 @@ class PGSQLClient(SimpleSingleton):
 
 class RedisClient(SimpleSingleton):
     _redis_pool: Optional[ConnectionPool] = None
+    _redis_pool_loop: Optional[asyncio.AbstractEventLoop] = None
     _connection_tested: bool = False
 
     def getRedisPool(self) -> ConnectionPool:
@@ -100,6 +106,16 @@ class RedisClient(SimpleSingleton):
         return self._redis_pool
 
     async def connect(self):
+        # Reuse the pool if already connected, every caller shares one pool
+        loop = asyncio.get_running_loop()
+        if self._redis_pool is not None:
+            if self._redis_pool_loop is loop:
+                return
+            # The pooled sockets belong to another event loop, which may be
+            # closed already, so they can neither be reused nor closed here
+            self._redis_pool = None
+            self._connection_tested = False
+
         redis_url = settings.REDIS_URL
         if not redis_url:
             raise ValueError("REDIS_URL is required but not provided")
@@ -112,6 +128,7 @@ class RedisClient(SimpleSingleton):
             socket_keepalive_options={},
             health_check_interval=60,
         )
+        self._redis_pool_loop = loop
 
     async def health_check(self):
         if self._connection_tested:
@@ -129,6 +146,12 @@ class RedisClient(SimpleSingleton):
             self._connection_tested = True
 
     async def close(self):
+        if self._redis_pool is not None:
+            if self._redis_pool_loop is asyncio.get_running_loop():
+                await self._redis_pool.aclose()
+            self._redis_pool = None
+            self._redis_pool_loop = None
+            self._connection_tested = False
         logging.info("Connection to Redis is closed.")
 
 
@@ -9,6 +9,7 @@ Enhanced with support for shared MCP services across worker processes and model
 """
 
 import asyncio
+import functools
 import logging
 import os
 import threading
@@ -25,6 +26,7 @@ from redis.asyncio import ConnectionPool, Redis
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from Sagi.services.model_client_service import ModelClientService
+from Sagi.utils.json_handler import json_dumps, json_loads
 
 from .mcp_cache_layer import CachedMCPService, MCPCacheLayer
 
@@ -35,38 +37,36 @@ if TYPE_CHECKING:
 def timing_logger(operation_name: str):
     """Decorator to log execution time of operations."""
 
+    def log_success(start_time: float) -> None:
+        duration = time.perf_counter() - start_time
+        logging.info(f"⏱️ [TIMING] {operation_name} completed in {duration:.3f}s")
+
+    def log_failure(start_time: float, e: Exception) -> None:
+        duration = time.perf_counter() - start_time
+        logging.error(f"⏱️ [TIMING] {operation_name} failed after {duration:.3f}s: {e}")
+
     def decorator(func):
+        @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                duration = time.time() - start_time
-                logging.info(
-                    f"⏱️ [TIMING] {operation_name} completed in {duration:.3f}s"
-                )
-                return result
             except Exception as e:
-                duration = time.time() - start_time
-                logging.error(
-                    f"⏱️ [TIMING] {operation_name} failed after {duration:.3f}s: {e}"
-                )
+                log_failure(start_time, e)
                 raise
+            log_success(start_time)
+            return result
 
+        @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
-                logging.info(
-                    f"⏱️ [TIMING] {operation_name} completed in {duration:.3f}s"
-                )
-                return result
             except Exception as e:
-                duration = time.time() - start_time
-                logging.error(
-                    f"⏱️ [TIMING] {operation_name} failed after {duration:.3f}s: {e}"
-                )
+                log_failure(start_time, e)
                 raise
+            log_success(start_time)
+            return result
 
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
@@ -96,10 +96,16 @@ class ResourceManager:
         """Ensure singleton pattern - one instance per process."""
         process_id = os.getpid()
 
+        # Fast path: the instance already exists for this process
+        instance = cls._instances.get(process_id)
+        if instance is not None:
+            return instance
+
         with cls._lock:  # Move lock outside to prevent race condition
-            if process_id not in cls._instances:
-                cls._instances[process_id] = super().__new__(cls)
-        return cls._instances[process_id]
+            instance = cls._instances.get(process_id)
+            if instance is None:
+                instance = cls._instances[process_id] = super().__new__(cls)
+        return instance
 
     def __init__(self):
         """Initialize the resource manager (called only once per process)."""
@@ -125,12 +131,8 @@ class ResourceManager:
             # Workflow pools
             self._workflow_pools: Dict[str, "WorkflowPool"] = {}
 
-            # Process tracking
-            self._main_process_pid: Optional[int] = None
-
-            # Initialization lock (will be created when first accessed)
-            self._init_lock: Optional[asyncio.Lock] = None
-            self._lock_creation_lock = threading.Lock()  # Thread-safe lock creation
+            # Initialization lock, asyncio locks bind to a loop on first use
+            self._init_lock = asyncio.Lock()
 
             # Mark this instance as initialized
             self._instance_initialized = True
@@ -140,14 +142,6 @@ class ResourceManager:
                 f"🚀 {process_type} ResourceManager instance created for process {os.getpid()}"
             )
 
-    def _ensure_init_lock(self) -> asyncio.Lock:
-        """Ensure initialization lock exists in a thread-safe manner."""
-        if self._init_lock is None:
-            with self._lock_creation_lock:
-                if self._init_lock is None:
-                    self._init_lock = asyncio.Lock()
-        return self._init_lock
-
     @timing_logger("ResourceManager.initialize")
     async def initialize(
         self,
@@ -168,7 +162,7 @@ class ResourceManager:
             workflow_configs: Configuration for workflow pools
             use_shared_mcp: Force use of shared MCP services (auto-detected if None)
         """
-        async with self._ensure_init_lock():
+        async with self._init_lock:
             if self._db_engine is not None:
                 logging.warning("⚠️ ResourceManager already initialized, skipping...")
                 return
@@ -194,7 +188,6 @@ class ResourceManager:
                 logging.info(
                     f"🏠 [MAIN-GLOBAL] Process {current_pid} will initialize direct MCP services"
                 )
-                self._main_process_pid = current_pid
 
             try:
                 # Initialize database engine with connection pool
@@ -237,13 +230,16 @@ class ResourceManager:
         Returns:
             ModelClientService: The singleton service instance
         """
-        if cls._model_client_service is None:
+        # Read the shared field once on the fast path
+        service = cls._model_client_service
+        if service is None:
             with cls._lock:
                 # Double-check pattern for thread safety
-                if cls._model_client_service is None:
-                    cls._model_client_service = ModelClientService()
+                service = cls._model_client_service
+                if service is None:
+                    service = cls._model_client_service = ModelClientService()
                     logging.info("🔧 ModelClientService singleton created")
-        return cls._model_client_service
+        return service
 
     @timing_logger("Database initialization")
     async def _initialize_database(self, postgres_url: str) -> None:
@@ -279,6 +275,9 @@ class ResourceManager:
             pool_recycle=3600,  # Recycle connections every hour
             pool_pre_ping=True,  # Verify connections before use
             echo=False,  # Set to True for SQL logging in development
+            # Let the driver (de)serialize JSON/JSONB columns with orjson
+            json_serializer=json_dumps,
+            json_deserializer=json_loads,
         )
 
         # Create session maker
@@ -431,6 +430,7 @@ class ResourceManager:
                 # Apply tool filters if specified
                 tool_filters = config.get("tool_filters", [])
                 if tool_filters:
+                    tool_filters = set(tool_filters)
                     tools = [tool for tool in tools if tool.name in tool_filters]
                     logging.info(
                         f"🔍 [MAIN-GLOBAL] Filtered tools for '{server_name}': {[tool.name for tool in tools]}"
@@ -943,15 +943,16 @@ class ResourceManager:
         if self._mcp_exit_stack is None:
             raise RuntimeError("MCP services not initialized. Call initialize() first.")
 
-        if server_name not in self._mcp_sessions:
+        session = self._mcp_sessions.get(server_name)
+        if session is None:
             raise KeyError(
                 f"MCP server session '{server_name}' not found. Available sessions: {list(self._mcp_sessions.keys())}"
             )
 
         logging.debug(
-            f"🔌 [MAIN-GLOBAL] Accessing MCP session for service: {server_name}"
+            "🔌 [MAIN-GLOBAL] Accessing MCP session for service: %s", server_name
         )
-        return self._mcp_sessions[server_name]
+        return session
 
     def get_mcp_tools(self, server_name: str) -> List[Any]:
         """Get MCP tools for a specific service."""
@@ -969,7 +970,8 @@ class ResourceManager:
                     "MCP services not initialized. Call initialize() first."
                 )
 
-        if server_name not in self._mcp_tools_cache:
+        tools = self._mcp_tools_cache.get(server_name)
+        if tools is None:
             available_services = list(self._mcp_tools_cache.keys())
             if self._use_shared_mcp:
                 logging.info(
@@ -981,15 +983,16 @@ class ResourceManager:
                     f"MCP service '{server_name}' not found. Available services: {available_services}"
                 )
 
-        tools = self._mcp_tools_cache[server_name]
-
         if self._use_shared_mcp:
             logging.debug(
-                f"🔧 [WORKER-SHARED] Worker process MCP access for '{server_name}' (not shared)"
+                "🔧 [WORKER-SHARED] Worker process MCP access for '%s' (not shared)",
+                server_name,
             )
         else:
             logging.debug(
-                f"🔧 [MAIN-GLOBAL] Main process MCP access for '{server_name}' ({len(tools)} tools)"
+                "🔧 [MAIN-GLOBAL] Main process MCP access for '%s' (%d tools)",
+                server_name,
+                len(tools),
             )
 
         if not tools and not self._use_shared_mcp:
@@ -1009,14 +1012,13 @@ class ResourceManager:
         Returns:
             CachedMCPService instance if available, None otherwise
         """
-        if service_name in self._cached_mcp_services:
-            cached_service = self._cached_mcp_services[service_name]
-
+        cached_service = self._cached_mcp_services.get(service_name)
+        if cached_service is not None:
             process_type = (
                 "[WORKER-SHARED]" if self._use_shared_mcp else "[MAIN-GLOBAL]"
             )
             logging.debug(
-                f"🔧 {process_type} Accessing cached MCP service: {service_name}"
+                "🔧 %s Accessing cached MCP service: %s", process_type, service_name
             )
 
             return cached_service
@@ -1039,9 +1041,10 @@ class ResourceManager:
 
     def get_workflow_pool(self, workflow_name: str) -> "WorkflowPool":
         """Get a workflow pool by name."""
-        if workflow_name not in self._workflow_pools:
+        pool = self._workflow_pools.get(workflow_name)
+        if pool is None:
             raise KeyError(f"Workflow pool '{workflow_name}' not found")
-        return self._workflow_pools[workflow_name]
+        return pool
 
     def list_mcp_servers(self) -> List[str]:
         """Get list of available MCP server names."""
@@ -1057,19 +1060,24 @@ class ResourceManager:
         """Get list of available workflow pool names."""
         return list(self._workflow_pools.keys())
 
-    def get_shared_mcp_tools(self) -> Optional[Dict[str, List[Any]]]:
+    def get_shared_mcp_tools(
+        self, label: str = "ResourceManager"
+    ) -> Optional[Dict[str, List[Any]]]:
         """
         Get shared MCP tools for workflow creation.
 
+        Args:
+            label: Prefix for the log messages
+
         Returns:
             Dict of MCP tools for main process, None for worker processes
             to trigger workflow's own MCP session creation.
         """
-        if self._is_worker_process():
+        if self._use_shared_mcp:
             # Worker process - return None to let workflow create its own MCP sessions
             # This is the intended behavior to avoid expensive cross-process resource sharing
             logging.info(
-                "🔧 [WORKER-SHARED] Worker process will let PlanningWorkflow create lightweight MCP sessions"
+                f"🔧 [WORKER-SHARED] {label} letting PlanningWorkflow create lightweight MCP sessions"
             )
             return None
         else:
@@ -1082,7 +1090,7 @@ class ResourceManager:
 
             # Log the actual tool counts for debugging
             logging.info(
-                f"🔧 [MAIN-GLOBAL] Providing shared MCP tools - web_search: {len(shared_mcp_tools.get('web_search', []))}, "
+                f"🔧 [MAIN-GLOBAL] {label} MCP tools - web_search: {len(shared_mcp_tools.get('web_search', []))}, "
                 f"domain_specific: {len(shared_mcp_tools.get('domain_specific', []))}, "
                 f"hirag_retrieval: {len(shared_mcp_tools.get('hirag_retrieval', []))}"
             )
@@ -1093,8 +1101,9 @@ class ResourceManager:
     def reset(cls):
         """Reset all services - useful for testing. Thread-safe."""
         with cls._lock:
-            if cls._model_client_service:
-                cls._model_client_service.clear_cache()
+            service = cls._model_client_service
+            if service:
+                service.clear_cache()
             cls._model_client_service = None
             # Reset per-process instances
             for instance in cls._instances.values():
@@ -1106,15 +1115,17 @@ class ResourceManager:
     @classmethod
     def get_service_status(cls) -> dict:
         """Get status of all managed services."""
-        status = {"model_client_service": cls._model_client_service is not None}
+        # reset() may clear the service concurrently, so read it only once
+        service = cls._model_client_service
+        status = {"model_client_service": service is not None}
 
-        if cls._model_client_service:
-            status["model_client_cache"] = cls._model_client_service.get_cache_info()
+        if service:
+            status["model_client_cache"] = service.get_cache_info()
 
         # Add status for current process instance
         current_pid = os.getpid()
-        if current_pid in cls._instances:
-            instance = cls._instances[current_pid]
+        instance = cls._instances.get(current_pid)
+        if instance is not None:
             status.update(
                 {
                     "database_initialized": instance._db_engine is not None,
@@ -1291,8 +1302,7 @@ class WorkflowPool:
         # Pool storage and synchronization
         self._available_workflows: List["PlanningWorkflow"] = []
         self._in_use_workflows: Dict[str, "PlanningWorkflow"] = {}
-        self._pool_lock: Optional[asyncio.Lock] = None
-        self._lock_creation_lock = threading.Lock()  # Thread-safe lock creation
+        self._pool_lock = asyncio.Lock()
 
         # Initialization flag
         self._initialized = False
@@ -1305,18 +1315,10 @@ class WorkflowPool:
             f"🏗️ {process_type} WorkflowPool '{workflow_name}' created with pool size {pool_size}"
         )
 
-    def _ensure_lock(self) -> asyncio.Lock:
-        """Ensure async lock exists in a thread-safe manner."""
-        if self._pool_lock is None:
-            with self._lock_creation_lock:
-                if self._pool_lock is None:
-                    self._pool_lock = asyncio.Lock()
-        return self._pool_lock
-
     @timing_logger("WorkflowPool.initialize")
     async def initialize(self) -> None:
         """Initialize the workflow pool by creating all workflow instances."""
-        async with self._ensure_lock():
+        async with self._pool_lock:
             # Check initialization status inside the lock to prevent race conditions
             if self._initialized:
                 process_type = (
@@ -1337,37 +1339,11 @@ class WorkflowPool:
             try:
                 for i in range(self.pool_size):
                     try:
-                        # Get shared MCP tools for the workflow
-                        shared_mcp_tools = None
-                        if self.resource_manager:
-                            if not self.resource_manager._use_shared_mcp:
-                                # Main process - use actual shared MCP tools
-                                shared_mcp_tools = {
-                                    "web_search": self.resource_manager._mcp_tools_cache.get(
-                                        "web_search", []
-                                    ),
-                                    "domain_specific": self.resource_manager._mcp_tools_cache.get(
-                                        "domain_specific", []
-                                    ),
-                                    "hirag_retrieval": self.resource_manager._mcp_tools_cache.get(
-                                        "hirag_retrieval", []
-                                    ),
-                                }
-
-                                # Log the actual tool counts for debugging
-                                logging.info(
-                                    f"🔧 [MAIN-GLOBAL] WorkflowPool MCP tools - web_search: {len(shared_mcp_tools.get('web_search', []))}, "
-                                    f"domain_specific: {len(shared_mcp_tools.get('domain_specific', []))}, "
-                                    f"hirag_retrieval: {len(shared_mcp_tools.get('hirag_retrieval', []))}"
-                                )
-                            else:
-                                # Worker process - create empty tools dict to trigger workflow's own MCP session creation
-                                # This avoids the expensive initialization that was happening before
-                                shared_mcp_tools = None
-                                process_type = "[WORKER-SHARED]"
-                                logging.info(
-                                    f"🔧 {process_type} WorkflowPool letting PlanningWorkflow create lightweight MCP sessions"
-                                )
+                        shared_mcp_tools = (
+                            self.resource_manager.get_shared_mcp_tools("WorkflowPool")
+                            if self.resource_manager
+                            else None
+                        )
 
                         # Dynamic import to avoid circular import
                         from Sagi.workflows import PlanningWorkflow
@@ -1437,7 +1413,7 @@ class WorkflowPool:
         if not self._initialized:
             raise RuntimeError(f"WorkflowPool '{self.workflow_name}' not initialized")
 
-        async with self._ensure_lock():
+        async with self._pool_lock:
             process_type = (
                 "[WORKER-SHARED]" if self._is_worker_process else "[MAIN-GLOBAL]"
             )
@@ -1453,36 +1429,11 @@ class WorkflowPool:
                     f"⚠️ {process_type} No workflows available in pool '{self.workflow_name}', creating temporary instance"
                 )
                 try:
-                    # Get shared MCP tools for the temporary workflow
-                    shared_mcp_tools = None
-                    if self.resource_manager:
-                        if not self.resource_manager._use_shared_mcp:
-                            # Main process - use actual shared MCP tools
-                            shared_mcp_tools = {
-                                "web_search": self.resource_manager._mcp_tools_cache.get(
-                                    "web_search", []
-                                ),
-                                "domain_specific": self.resource_manager._mcp_tools_cache.get(
-                                    "domain_specific", []
-                                ),
-                                "hirag_retrieval": self.resource_manager._mcp_tools_cache.get(
-                                    "hirag_retrieval", []
-                                ),
-                            }
-
-                            # Log the actual tool counts for debugging
-                            logging.info(
-                                f"🔧 [MAIN-GLOBAL] Temporary workflow MCP tools - web_search: {len(shared_mcp_tools.get('web_search', []))}, "
-                                f"domain_specific: {len(shared_mcp_tools.get('domain_specific', []))}, "
-                                f"hirag_retrieval: {len(shared_mcp_tools.get('hirag_retrieval', []))}"
-                            )
-                        else:
-                            # Worker process - create empty tools dict to trigger workflow's own MCP session creation
-                            shared_mcp_tools = None
-                            process_type = "[WORKER-SHARED]"
-                            logging.info(
-                                f"🔧 {process_type} Temporary workflow will create lightweight MCP sessions"
-                            )
+                    shared_mcp_tools = (
+                        self.resource_manager.get_shared_mcp_tools("Temporary workflow")
+                        if self.resource_manager
+                        else None
+                    )
 
                     # Dynamic import to avoid circular import
                     from Sagi.workflows import PlanningWorkflow
@@ -1534,8 +1485,9 @@ class WorkflowPool:
         Args:
             session_id: Session identifier that was using the workflow
         """
-        async with self._ensure_lock():
-            if session_id not in self._in_use_workflows:
+        async with self._pool_lock:
+            workflow = self._in_use_workflows.pop(session_id, None)
+            if workflow is None:
                 process_type = (
                     "[WORKER-SHARED]" if self._is_worker_process else "[MAIN-GLOBAL]"
                 )
@@ -1544,8 +1496,6 @@ class WorkflowPool:
                 )
                 return
 
-            workflow = self._in_use_workflows.pop(session_id)
-
             try:
                 # Reset workflow state before returning to pool
                 await workflow.team.reset()
@@ -1559,13 +1509,17 @@ class WorkflowPool:
                         else "[MAIN-GLOBAL]"
                     )
                     logging.debug(
-                        f"✅ {process_type} Returned workflow for session '{session_id}' to pool '{self.workflow_name}'"
+                        "✅ %s Returned workflow for session '%s' to pool '%s'",
+                        process_type,
+                        session_id,
+                        self.workflow_name,
                     )
                 else:
                     # Pool is full, cleanup the excess workflow
                     await workflow.cleanup()
                     logging.debug(
-                        f"🧹 Pool full, cleaned up excess workflow for session '{session_id}'"
+                        "🧹 Pool full, cleaned up excess workflow for session '%s'",
+                        session_id,
                     )
 
             except Exception as e:
@@ -1641,28 +1595,23 @@ class WorkflowPool:
             f"🧹 {process_type} Cleaning up WorkflowPool '{self.workflow_name}'..."
         )
 
-        async with self._ensure_lock():
-            # Cleanup available workflows
-            await self._cleanup_workflows(self._available_workflows)
-            self._available_workflows.clear()
-
-            # Cleanup in-use workflows
-            in_use_list = list(self._in_use_workflows.values())
-            await self._cleanup_workflows(in_use_list)
+        # Detach the workflows under the lock, then clean them up outside it
+        async with self._pool_lock:
+            available_workflows = self._available_workflows
+            in_use_workflows = list(self._in_use_workflows.values())
+            self._available_workflows = []
             self._in_use_workflows.clear()
-
             self._initialized = False
 
+        await self._cleanup_workflows(available_workflows)
+        await self._cleanup_workflows(in_use_workflows)
+
         process_type = "[WORKER-SHARED]" if self._is_worker_process else "[MAIN-GLOBAL]"
         logging.info(
             f"✅ {process_type} WorkflowPool '{self.workflow_name}' cleanup completed"
         )
 
 
-# Per-process instances for easy access
-_resource_managers: Dict[int, ResourceManager] = {}
-
-
 def get_resource_manager() -> ResourceManager:
     """
     Get the global resource manager instance for this process.
@@ -1670,10 +1619,8 @@ def get_resource_manager() -> ResourceManager:
     Returns:
         ResourceManager singleton instance for this process
     """
-    process_id = os.getpid()
-    if process_id not in _resource_managers:
-        _resource_managers[process_id] = ResourceManager()
-    return _resource_managers[process_id]
+    # ResourceManager keeps the per-process instances itself
+    return ResourceManager()
 
 
 # Convenience functions for common operations
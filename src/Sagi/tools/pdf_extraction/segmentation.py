@@ -1,4 +1,3 @@
-import json
 import os
 import random
 import string
@@ -13,6 +12,7 @@ from Sagi.tools.pdf_extraction._utils import (
     upload_file_to_s3,
 )
 from Sagi.tools.pdf_extraction.extraction_data import RectData
+from Sagi.utils.json_handler import read_json
 
 
 @dataclass
@@ -73,10 +73,7 @@ class Segmentation:
 
     @classmethod
     def load_json_per_page(cls, storage_json_path: str):
-        with open(storage_json_path, "r") as file:
-            json_data = json.load(file)
-
-        json_data = json_data["layout_dets"]
+        json_data = read_json(storage_json_path)["layout_dets"]
         rect_info = []
         index_map: Dict[str, int] = {}
         for block in json_data:
@@ -122,7 +119,7 @@ class Segmentation:
             rect_data = [rect.to_rect_data() for rect in rect_info]
             result.append(rect_data)
 
-        json_data = json.load(open(os.path.join(storage_dir, "page_0.json")))
+        json_data = read_json(os.path.join(storage_dir, "page_0.json"))
         height = json_data["page_info"]["height"] * 72 / 200
         width = json_data["page_info"]["width"] * 72 / 200
         leftmost = min(rect.x0 for rect_data in result for rect in rect_data)
@@ -388,10 +388,15 @@ class StreamDockerCommandLineCodeExecutor(
 
         if os.getenv("AWS_ACCESS_KEY_ID", None) != None:
             s3_client = boto3.client("s3")
-            for filename in os.listdir((self.work_dir / chat_id)):
-                print(f"Uploading {filename} to s3")
-                s3_client.upload_file(
-                    (self.work_dir / chat_id / filename),
-                    os.getenv("AWS_BUCKET_NAME"),
-                    os.path.join(user_id, chat_id, filename),
-                )
+            # scandir yields the entry type with the name, so directories are
+            # skipped without an extra stat per file
+            with os.scandir(self.work_dir / chat_id) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    print(f"Uploading {entry.name} to s3")
+                    s3_client.upload_file(
+                        entry.path,
+                        os.getenv("AWS_BUCKET_NAME"),
+                        os.path.join(user_id, chat_id, entry.name),
+                    )
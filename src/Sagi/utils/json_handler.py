@@ -1,4 +1,38 @@
 import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(file_path: str) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        file_path: The path to the JSON file.
+
+    Returns:
+        The parsed JSON document.
+    """
+    with open(file_path, "rb") as f:
+        return json_loads(f.read())
 
 
 def format_file_content(file_content_path: str):
@@ -11,8 +45,7 @@ def format_file_content(file_content_path: str):
     Returns:
         str: The formatted string.
     """
-    with open(file_content_path, "r", encoding="utf-8") as f:
-        file_content = json.load(f)
+    file_content = read_json(file_content_path)
 
     formatted_texts = []
 
@@ -52,8 +85,7 @@ def format_file_content(file_content_path: str):
 
 
 def format_templates(slide_induction_path: str):
-    with open(slide_induction_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = read_json(slide_induction_path)
 
     # Filter out non-template items
     templates = {
@@ -101,8 +133,7 @@ def format_slide_info(slide: dict):
 
 def get_template_num(slide_induction_path: str):
     template_num = 0
-    with open(slide_induction_path, "r", encoding="utf-8") as f:
-        slide_induction = json.load(f)
+    slide_induction = read_json(slide_induction_path)
 
     for v in slide_induction.values():
         if isinstance(v, dict) and "template_id" in v:
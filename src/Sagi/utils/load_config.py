@@ -1,10 +1,13 @@
-import json
+import copy
+import logging
 import os
 import re
-from typing import Any, Dict, Union
+from typing import Any, Dict, Tuple, Union
 
 import tomli
 
+from Sagi.utils.json_handler import read_json
+
 
 def _replace_env_vars(field: str) -> str:
     """
@@ -61,6 +64,9 @@ def replace_env_vars_in_dict(field: Union[Dict[str, Any], str]) -> Any:
     """
     if isinstance(field, dict):
         return {k: replace_env_vars_in_dict(v) for k, v in field.items()}
+    elif isinstance(field, list):
+        # Copied as-is rather than shared, so callers never mutate the cached parse
+        return copy.deepcopy(field)
     elif isinstance(field, str):
         return _replace_env_vars(field)
 
@@ -69,19 +75,34 @@ def replace_env_vars_in_dict(field: Union[Dict[str, Any], str]) -> Any:
 
 def read_json_with_env_vars(file_path: str) -> Dict[str, Any]:
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = read_json(file_path)
     except Exception as e:
         raise ValueError(f"Error loading JSON file {file_path}: {e}")
 
     return replace_env_vars_in_dict(data)
 
 
+# Parsed TOML files keyed by path, as (st_mtime_ns, data). Environment
+# variables are substituted on every load, so only the parse is cached.
+_toml_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
 def load_toml_with_env_vars(file_path: str):
+    cached = _toml_cache.get(file_path)
     try:
-        with open(file_path, "rb") as f:
-            data = tomli.load(f)
+        mtime = os.stat(file_path).st_mtime_ns
+        if cached is not None and cached[0] == mtime:
+            data = cached[1]
+        else:
+            with open(file_path, "rb") as f:
+                data = tomli.load(f)
+            _toml_cache[file_path] = (mtime, data)
     except Exception as e:
-        raise ValueError(f"Error loading TOML file {file_path}: {e}")
+        if cached is None:
+            raise ValueError(f"Error loading TOML file {file_path}: {e}")
+        logging.warning(
+            f"⚠️ Error reloading TOML file {file_path}, using the cached copy: {e}"
+        )
+        data = cached[1]
 
     return replace_env_vars_in_dict(data)
@@ -1,6 +1,9 @@
+import atexit
 import json
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 from autogen_agentchat import TRACE_LOGGER_NAME
 from autogen_core.logging import LLMCallEvent, LLMStreamEndEvent, LLMStreamStartEvent
@@ -144,6 +147,13 @@ class ReadableFormatter(logging.Formatter):
         return "\n".join(indent + line for line in text.split("\n"))
 
 
+class _RecordQueueHandler(QueueHandler):
+    """Queue records as-is so the file handler still sees the LLM event objects."""
+
+    def prepare(self, record):
+        return record
+
+
 def setup_logging():
     # Create file handler with custom filter
     file_handler = logging.FileHandler(
@@ -157,10 +167,17 @@ def setup_logging():
     )
     file_handler.addFilter(LLMFilter())
 
+    # Write the log file from a background thread so logging calls on the
+    # event loop don't block on disk I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Create logger and add handler
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
-    logger.addHandler(file_handler)
+    logger.addHandler(_RecordQueueHandler(log_queue))
 
     # For trace logging with filter
     trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
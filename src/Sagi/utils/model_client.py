@@ -11,9 +11,7 @@ class ModelClientFactory:
     @staticmethod
     def _init_model_info(client_config: Dict[str, Any]) -> Optional[ModelInfo]:
         if "model_info" in client_config:
-            model_info = client_config["model_info"]
-            model_info["family"] = ModelFamily.UNKNOWN
-            return ModelInfo(**model_info)
+            return {**client_config["model_info"], "family": ModelFamily.UNKNOWN}
         return None
 
     @staticmethod
@@ -21,16 +19,17 @@ class ModelClientFactory:
         client_config: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Apply provider-specific configurations based on base_url."""
-        config = client_config.copy()
-        base_url = config.get("base_url", "")
+        base_url = client_config.get("base_url", "")
 
         # yunwu.ai specific configurations
         if "yunwu.ai" in base_url:
             # Ensure stream_options for token usage tracking
-            if "stream_options" not in config:
-                config["stream_options"] = {"include_usage": True}
+            if "stream_options" not in client_config:
+                # Copy only when a field is added, the config is otherwise
+                # read-only here
+                return {**client_config, "stream_options": {"include_usage": True}}
 
-        return config
+        return client_config
 
     @classmethod
     def create_model_client(
@@ -42,12 +41,14 @@ class ModelClientFactory:
         # Apply provider-specific configurations
         client_config = cls._apply_provider_specific_config(client_config)
 
-        model_info = cls._init_model_info(client_config)
+        # The remaining client_config keys are passed through as-is, the
+        # explicit values below take precedence over them
         client_kwargs = {
+            **client_config,
             "model": client_config["model"],
             "base_url": client_config["base_url"],
             "api_key": client_config["api_key"],
-            "model_info": model_info,
+            "model_info": cls._init_model_info(client_config),
             "max_tokens": client_config.get("max_tokens", 16000),
         }
 
@@ -57,9 +58,4 @@ class ModelClientFactory:
         if parallel_tool_calls is not None:
             client_kwargs["parallel_tool_calls"] = parallel_tool_calls
 
-        # Add the remaining client kwargs from the client_config
-        for key, value in client_config.items():
-            if key not in client_kwargs:
-                client_kwargs[key] = value
-
         return OpenAIChatCompletionClient(**client_kwargs)
@@ -1,5 +1,110 @@
+import copy
 from typing import Any, Dict
 
+# Built once at import, the lookups below only read from these tables
+_MODEL_INFO = {
+    # OpenAI models
+    # https://platform.openai.com/docs/models/gpt-4o
+    "gpt-4o": {
+        "provider": "openai",
+        "max_tokens": 16384,
+        "context_window": 128000,
+        "input": ["text", "image"],
+        "output": ["text"],
+        "stream": True,
+    },
+    # https://platform.openai.com/docs/models/gpt-4o-mini
+    "gpt-4o-mini": {
+        "provider": "openai",
+        "max_tokens": 16384,
+        "context_window": 128000,
+        "input": ["text", "image"],
+        "stream": True,
+    },
+    # https://platform.openai.com/docs/models/gpt-4.1
+    "gpt-4.1": {
+        "provider": "openai",
+        "max_tokens": 32768,
+        "context_window": 1047576,
+        "input": ["text", "image"],
+        "output": ["text"],
+        "stream": True,
+    },
+    # Anthropic models
+    # https://docs.anthropic.com/en/docs/about-claude/models/overview#model-comparison-table
+    "claude-opus-4": {
+        "provider": "anthropic",
+        "max_tokens": 32000,
+        "context_window": 200000,
+        "input": ["text", "image"],
+        "output": ["text"],
+        "stream": True,
+    },
+    "claude-sonnet-4": {
+        "provider": "anthropic",
+        "max_tokens": 64000,
+        "context_window": 200000,
+        "input": ["text", "image"],
+        "output": ["text"],
+        "stream": True,
+    },
+    # DeepSeek models
+    "deepseek-r1": {
+        "provider": "deepseek",
+        "max_tokens": 32768,
+        "context_window": 128000,
+        "type": "multimodal",
+        "stream": True,
+    },
+    # Qwen models
+    "qwen-turbo": {
+        "provider": "qwen",
+        "max_tokens": 32768,
+        "context_window": 1000000,
+        "input": ["text", "image"],
+        "output": ["text"],
+        "stream": True,
+    },
+    "qwen-plus": {
+        "provider": "qwen",
+        "max_tokens": 32768,
+        "context_window": 100000,
+        "type": "multimodal",
+        "stream": True,
+    },
+    "qwen-max": {
+        "provider": "qwen",
+        "max_tokens": 32768,
+        "context_window": 100000,
+        "type": "multimodal",
+        "stream": True,
+    },
+}
+
+_AIML_MODEL_NAMES = {
+    "gpt-4o": "gpt-4o",
+    "gpt-4o-mini": "gpt-4o-mini",
+    "gpt-4.1": "openai/gpt-4.1-2025-04-14",
+    "claude-opus-4": "anthropic/claude-opus-4",
+    "claude-sonnet-4": "anthropic/claude-sonnet-4",
+    "deepseek-r1": "deepseek/deepseek-r1",
+    "qwen-turbo": "qwen-turbo",
+    "qwen-plus": "qwen-plus",
+    "qwen-max": "qwen-max",
+}
+
+_YUNWU_MODEL_NAMES = {
+    "gpt-4o": "chatgpt-4o-latest",
+    "gpt-4o-mini": "gpt-4o-mini",
+    "gpt-4.1": "gpt-4.1-2025-04-14",
+    "claude-opus-4": "claude-opus-4-20250514",
+    "claude-sonnet-4": "claude-sonnet-4-20250514",
+    "deepseek-r1": "deepseek-r1",
+    "qwen-turbo": "qwen-turbo",
+    "qwen-plus": "qwen-plus",
+    "qwen-max": "qwen-max",
+}
+
 
 def get_model_info(model_name: str) -> Dict[str, Any]:
     """
@@ -11,89 +116,11 @@ def get_model_info(model_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing model information including provider, max_tokens, etc.
     """
-    model_info = {
-        # OpenAI models
-        # https://platform.openai.com/docs/models/gpt-4o
-        "gpt-4o": {
-            "provider": "openai",
-            "max_tokens": 16384,
-            "context_window": 128000,
-            "input": ["text", "image"],
-            "output": ["text"],
-            "stream": True,
-        },
-        # https://platform.openai.com/docs/models/gpt-4o-mini
-        "gpt-4o-mini": {
-            "provider": "openai",
-            "max_tokens": 16384,
-            "context_window": 128000,
-            "input": ["text", "image"],
-            "stream": True,
-        },
-        # https://platform.openai.com/docs/models/gpt-4.1
-        "gpt-4.1": {
-            "provider": "openai",
-            "max_tokens": 32768,
-            "context_window": 1047576,
-            "input": ["text", "image"],
-            "output": ["text"],
-            "stream": True,
-        },
-        # Anthropic models
-        # https://docs.anthropic.com/en/docs/about-claude/models/overview#model-comparison-table
-        "claude-opus-4": {
-            "provider": "anthropic",
-            "max_tokens": 32000,
-            "context_window": 200000,
-            "input": ["text", "image"],
-            "output": ["text"],
-            "stream": True,
-        },
-        "claude-sonnet-4": {
-            "provider": "anthropic",
-            "max_tokens": 64000,
-            "context_window": 200000,
-            "input": ["text", "image"],
-            "output": ["text"],
-            "stream": True,
-        },
-        # DeepSeek models
-        "deepseek-r1": {
-            "provider": "deepseek",
-            "max_tokens": 32768,
-            "context_window": 128000,
-            "type": "multimodal",
-            "stream": True,
-        },
-        # Qwen models
-        "qwen-turbo": {
-            "provider": "qwen",
-            "max_tokens": 32768,
-            "context_window": 1000000,
-            "input": ["text", "image"],
-            "output": ["text"],
-            "stream": True,
-        },
-        "qwen-plus": {
-            "provider": "qwen",
-            "max_tokens": 32768,
-            "context_window": 100000,
-            "type": "multimodal",
-            "stream": True,
-        },
-        "qwen-max": {
-            "provider": "qwen",
-            "max_tokens": 32768,
-            "context_window": 100000,
-            "type": "multimodal",
-            "stream": True,
-        },
-    }
-
-    result = model_info.get(model_name)
+    result = _MODEL_INFO.get(model_name)
     if result is None:
         raise ValueError(f"Model {model_name} not found")
-    return result
+    # Callers get their own copy, the shared table must stay untouched
+    return copy.deepcopy(result)
 
 
 def get_model_name_by_api_provider(api_provider: str, model_name: str) -> str:
@@ -107,35 +134,13 @@ def get_model_name_by_api_provider(api_provider: str, model_name: str) -> str:
     Returns:
         The model name
     """
-    aiml_model_name = {
-        "gpt-4o": "gpt-4o",
-        "gpt-4o-mini": "gpt-4o-mini",
-        "gpt-4.1": "openai/gpt-4.1-2025-04-14",
-        "claude-opus-4": "anthropic/claude-opus-4",
-        "claude-sonnet-4": "anthropic/claude-sonnet-4",
-        "deepseek-r1": "deepseek/deepseek-r1",
-        "qwen-turbo": "qwen-turbo",
-        "qwen-plus": "qwen-plus",
-        "qwen-max": "qwen-max",
-    }
-    yunwu_model_name = {
-        "gpt-4o": "chatgpt-4o-latest",
-        "gpt-4o-mini": "gpt-4o-mini",
-        "gpt-4.1": "gpt-4.1-2025-04-14",
-        "claude-opus-4": "claude-opus-4-20250514",
-        "claude-sonnet-4": "claude-sonnet-4-20250514",
-        "deepseek-r1": "deepseek-r1",
-        "qwen-turbo": "qwen-turbo",
-        "qwen-plus": "qwen-plus",
-        "qwen-max": "qwen-max",
-    }
     match api_provider:
         case "yunwu":
-            model_name_api = yunwu_model_name.get(model_name)
+            model_name_api = _YUNWU_MODEL_NAMES.get(model_name)
             if model_name_api is None:
                 raise ValueError(f"Model {model_name} not found in yunwu model name")
         case "aiml":
-            model_name_api = aiml_model_name.get(model_name)
+            model_name_api = _AIML_MODEL_NAMES.get(model_name)
             if model_name_api is None:
                 raise ValueError(f"Model {model_name} not found in aiml model name")
         case _:
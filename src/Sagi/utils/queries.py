@@ -60,24 +60,27 @@ async def saveMultiRoundMemories(
         print(f"Failed to generate embeddings: {e}")
         embeddings = [None] * len(contents)
 
+    memories = []
     for i, content_data in enumerate(contents):
         # Use the corresponding embedding from the batch
-        timestamp = datetime.now().isoformat()
         embedding = embeddings[i] if i < len(embeddings) else None
 
-        memory = MultiRoundMemory(
-            id=str(uuid.uuid4()),
-            chatId=chat_id,
-            content=content_data["content"],
-            source=content_data["source"],
-            mimeType=content_data["mime_type"],
-            messageId=content_data["message_id"],
-            embedding=embedding,
-            createdAt=datetime.now(),
+        memories.append(
+            MultiRoundMemory(
+                id=str(uuid.uuid4()),
+                chatId=chat_id,
+                content=content_data["content"],
+                source=content_data["source"],
+                mimeType=content_data["mime_type"],
+                messageId=content_data["message_id"],
+                embedding=embedding,
+                createdAt=datetime.now(),
+            )
         )
-        session.add(memory)
-        await session.commit()
-        await session.refresh(memory)
+
+    # Insert the whole batch in a single transaction
+    session.add_all(memories)
+    await session.commit()
 
 
 async def getMultiRoundMemory(
@@ -5,7 +5,6 @@ from autogen_core.memory import MemoryContent
 from autogen_core.models import LLMMessage
 from configs.functions import get_llm_provider
 from pydantic import BaseModel
-from transformers import AutoTokenizer
 
 
 def count_tokens_openai(text: str, model: str = "gpt-4") -> int:
@@ -98,6 +97,9 @@ def count_tokens_deepseek(text: str) -> int:
 
 def count_tokens_local(content: str, model: str, provider: str) -> int:
     if provider[6:] == "qwen3-8b":
+        # transformers is heavy to import and only needed for local models
+        from transformers import AutoTokenizer
+
         tokenizer = AutoTokenizer.from_pretrained("Qwen/Qwen3-8B")
         return len(tokenizer.encode(content))
     else:
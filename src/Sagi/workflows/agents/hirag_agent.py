@@ -139,7 +139,7 @@ class RagSummaryAgent:
         try:
             # Skip memory augmentation if memory is None (e.g., in batch jobs)
             if self.memory is not None:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 memory_query_result = await self.memory.query(
                     query=user_input, type="rag"
                 )
@@ -159,7 +159,7 @@ class RagSummaryAgent:
                         prompt=memory_augmented_user_input_prompt,
                         model=get_llm_config().model_name,
                     )
-                    duration_seconds = time.time() - start_time
+                    duration_seconds = time.perf_counter() - start_time
                     changed = self.augmented_user_input.strip() != user_input.strip()
                     logging.info(
                         f"RAG memory augmented used={changed} duration_seconds={duration_seconds:.2f}"
@@ -1,5 +1,4 @@
 import os
-from contextlib import AsyncExitStack
 from typing import Optional
 
 from autogen_agentchat.agents import AssistantAgent
@@ -14,29 +13,13 @@ from autogen_ext.tools.mcp import (
 
 from Sagi.tools.web_search_agent import WebSearchAgent
 from Sagi.utils.load_config import load_toml_with_env_vars
+from Sagi.utils.mcp_utils import MCPSessionManager
+from Sagi.utils.model_client import ModelClientFactory
 from Sagi.utils.prompt import get_general_agent_prompt, get_web_search_agent_prompt
-from Sagi.workflows.planning.planning import ModelClientFactory
 
 DEFAULT_WEB_SEARCH_MAX_RETRIES = 3
 
 
-class MCPSessionManager:
-    def __init__(self):
-        self.exit_stack = AsyncExitStack()
-        self.sessions = {}
-
-    async def create_session(self, name: str, context_manager):
-        """create and store a session"""
-        session = await self.exit_stack.enter_async_context(context_manager)
-        self.sessions[name] = session
-        return session
-
-    async def close_all(self):
-        """close all sessions"""
-        await self.exit_stack.aclose()
-        self.sessions.clear()
-
-
 class GeneralChatWorkflow:
     @classmethod
     async def create(
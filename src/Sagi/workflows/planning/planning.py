@@ -1,13 +1,11 @@
 import logging
 import os
-from contextlib import AsyncExitStack
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Type, TypeVar
+from typing import Any, Dict, List, Literal, Optional
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_core import CancellationToken
-from autogen_core.models import ModelFamily, ModelInfo
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.tools.mcp import (
     StdioServerParams,
@@ -26,6 +24,8 @@ from Sagi.tools.stream_code_executor.stream_docker_command_line_code_executor im
 from Sagi.tools.web_search_agent import WebSearchAgent
 from Sagi.utils.json_handler import get_template_num
 from Sagi.utils.load_config import load_toml_with_env_vars
+from Sagi.utils.mcp_utils import MCPSessionManager
+from Sagi.utils.model_client import ModelClientFactory
 from Sagi.utils.prompt import (
     get_code_executor_prompt,
     get_code_executor_prompt_cn,
@@ -70,87 +70,6 @@ class ReflectionResponse(BaseModel):
     reason: str
 
 
-class MCPSessionManager:
-    def __init__(self):
-        self.exit_stack = AsyncExitStack()
-        self.sessions = {}
-
-    async def create_session(self, name: str, context_manager):
-        """create and store a session"""
-        session = await self.exit_stack.enter_async_context(context_manager)
-        self.sessions[name] = session
-        return session
-
-    async def close_all(self):
-        """close all sessions"""
-        await self.exit_stack.aclose()
-        self.sessions.clear()
-
-
-T = TypeVar("T", bound=BaseModel)
-
-
-class ModelClientFactory:
-    @staticmethod
-    def _init_model_info(client_config: Dict[str, Any]) -> Optional[ModelInfo]:
-        if "model_info" in client_config:
-            model_info = client_config["model_info"]
-            model_info["family"] = ModelFamily.UNKNOWN
-            return ModelInfo(**model_info)
-        return None
-
-    @staticmethod
-    def _apply_provider_specific_config(
-        client_config: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """Apply provider-specific configurations based on base_url."""
-        config = client_config.copy()
-        base_url = config.get("base_url", "")
-
-        # yunwu.ai specific configurations
-        if "yunwu.ai" in base_url:
-            # Ensure stream_options for token usage tracking
-            if "stream_options" not in config:
-                config["stream_options"] = {"include_usage": True}
-
-        return config
-
-    @classmethod
-    def create_model_client(
-        cls,
-        client_config: Dict[str, Any],
-        response_format: Optional[Type[T]] = None,
-        parallel_tool_calls: Optional[bool] = None,
-    ) -> OpenAIChatCompletionClient:
-        # Apply provider-specific configurations
-        client_config = cls._apply_provider_specific_config(client_config)
-
-        model_info = cls._init_model_info(client_config)
-        client_kwargs = {
-            "model": client_config["model"],
-            "base_url": client_config["base_url"],
-            "api_key": client_config["api_key"],
-            "model_info": model_info,
-            "max_tokens": client_config["max_tokens"],
-        }
-
-        if response_format:
-            client_kwargs["response_format"] = response_format
-
-        if parallel_tool_calls is not None:
-            client_kwargs["parallel_tool_calls"] = parallel_tool_calls
-
-        if "default_headers" in client_config:
-            client_kwargs["default_headers"] = client_config["default_headers"]
-
-        # Add the remaining client kwargs from the client_config
-        for key, value in client_config.items():
-            if key not in client_kwargs:
-                client_kwargs[key] = value
-
-        return OpenAIChatCompletionClient(**client_kwargs)
-
-
 class PlanningWorkflow:
     orchestrator_model_client: OpenAIChatCompletionClient
     reflection_model_client: OpenAIChatCompletionClient
@@ -1,11 +1,9 @@
 import os
-from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Literal, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_core import CancellationToken
-from autogen_core.models import ModelFamily, ModelInfo
-from autogen_ext.models.anthropic import AnthropicChatCompletionClient
+from autogen_core.models import ModelInfo
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_ext.tools.mcp import (
     StdioServerParams,
@@ -17,6 +15,8 @@ from pydantic import BaseModel
 
 from Sagi.tools.web_search_agent import WebSearchAgent
 from Sagi.utils.load_config import load_toml_with_env_vars
+from Sagi.utils.mcp_utils import MCPSessionManager
+from Sagi.utils.model_client import ModelClientFactory
 from Sagi.utils.prompt import (
     get_domain_specific_agent_prompt,
     get_domain_specific_agent_prompt_cn,
@@ -25,6 +25,9 @@ from Sagi.utils.prompt import (
 )
 from Sagi.workflows.planning_html.planning_html_group_chat import PlanningHtmlGroupChat
 
+if TYPE_CHECKING:
+    from autogen_ext.models.anthropic import AnthropicChatCompletionClient
+
 DEFAULT_WORK_DIR = "coding_files"
 DEFAULT_MCP_SERVER_PATH = "src/Sagi/mcp_server/"
 DEFAULT_WEB_SEARCH_MAX_RETRIES = 3
@@ -60,84 +63,6 @@ class ReflectionResponse(BaseModel):
     reason: str
 
 
-class MCPSessionManager:
-    def __init__(self):
-        self.exit_stack = AsyncExitStack()
-        self.sessions = {}
-
-    async def create_session(self, name: str, context_manager):
-        """create and store a session"""
-        session = await self.exit_stack.enter_async_context(context_manager)
-        self.sessions[name] = session
-        return session
-
-    async def close_all(self):
-        """close all sessions"""
-        await self.exit_stack.aclose()
-        self.sessions.clear()
-
-
-T = TypeVar("T", bound=BaseModel)
-
-
-class ModelClientFactory:
-    @staticmethod
-    def _init_model_info(client_config: Dict[str, Any]) -> Optional[ModelInfo]:
-        if "model_info" in client_config:
-            model_info = client_config["model_info"]
-            model_info["family"] = ModelFamily.UNKNOWN
-            return ModelInfo(**model_info)
-        return None
-
-    @staticmethod
-    def _apply_provider_specific_config(
-        client_config: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        """Apply provider-specific configurations based on base_url."""
-        config = client_config.copy()
-        base_url = config.get("base_url", "")
-
-        # yunwu.ai specific configurations
-        if "yunwu.ai" in base_url:
-            # Ensure stream_options for token usage tracking
-            if "stream_options" not in config:
-                config["stream_options"] = {"include_usage": True}
-
-        return config
-
-    @classmethod
-    def create_model_client(
-        cls,
-        client_config: Dict[str, Any],
-        response_format: Optional[Type[T]] = None,
-        parallel_tool_calls: Optional[bool] = None,
-    ) -> OpenAIChatCompletionClient:
-        # Apply provider-specific configurations
-        client_config = cls._apply_provider_specific_config(client_config)
-
-        model_info = cls._init_model_info(client_config)
-        client_kwargs = {
-            "model": client_config["model"],
-            "base_url": client_config["base_url"],
-            "api_key": client_config["api_key"],
-            "model_info": model_info,
-            "max_tokens": client_config["max_tokens"],
-        }
-
-        if response_format:
-            client_kwargs["response_format"] = response_format
-
-        if parallel_tool_calls is not None:
-            client_kwargs["parallel_tool_calls"] = parallel_tool_calls
-
-        # Add the remaining client kwargs from the client_config
-        for key, value in client_config.items():
-            if key not in client_kwargs:
-                client_kwargs[key] = value
-
-        return OpenAIChatCompletionClient(**client_kwargs)
-
-
 class PlanningHtmlWorkflow:
     orchestrator_model_client: OpenAIChatCompletionClient
     reflection_model_client: OpenAIChatCompletionClient
@@ -146,7 +71,7 @@ class PlanningHtmlWorkflow:
     single_tool_use_model_client: OpenAIChatCompletionClient
     planning_model_client: OpenAIChatCompletionClient
     single_group_planning_model_client: OpenAIChatCompletionClient
-    html_generator_model_client: AnthropicChatCompletionClient
+    html_generator_model_client: "AnthropicChatCompletionClient"
     web_search: ClientSession
     session_manager: MCPSessionManager
     team: PlanningHtmlGroupChat
@@ -217,6 +142,9 @@ class PlanningHtmlWorkflow:
             )
         )
 
+        # The Anthropic SDK is only needed by this workflow, import it on use
+        from autogen_ext.models.anthropic import AnthropicChatCompletionClient
+
         config_html_generator_client = config["model_clients"]["html_generator_client"]
         self.html_generator_model_client = AnthropicChatCompletionClient(
             model=config_html_generator_client["model"],
@@ -56,6 +56,8 @@ async def test_redis_client_singleton():
     assert redis_client_2._connection_tested is True
     assert dbm.getRedisClient()._connection_tested is True
 
+    await redis_client_1.close()
+
 
 @pytest.mark.asyncio
 async def test_db_manager():
@@ -60,7 +60,7 @@ async def main_cmd(args: argparse.Namespace):
             if user_input.lower() in ("quit", "exit", "q"):
                 break
 
-            await asyncio.create_task(Console(workflow.run_workflow(user_input)))
+            await Console(workflow.run_workflow(user_input))
     finally:
         await workflow.cleanup()
         logging.info("Workflow cleaned up.")
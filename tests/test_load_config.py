@@ -0,0 +1,38 @@
+import os
+
+from Sagi.utils.load_config import load_toml_with_env_vars
+
+
+def test_load_toml_reloads_on_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEST_BASE_URL", "http://localhost:8000")
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[model_client]\nbase_url = "${TEST_BASE_URL}"\n')
+
+    config = load_toml_with_env_vars(str(config_path))
+    assert config["model_client"]["base_url"] == "http://localhost:8000"
+
+    # Env vars are substituted on every load, even from the cached parse
+    monkeypatch.setenv("TEST_BASE_URL", "http://localhost:9000")
+    config = load_toml_with_env_vars(str(config_path))
+    assert config["model_client"]["base_url"] == "http://localhost:9000"
+
+    config_path.write_text('[model_client]\nbase_url = "http://example.com"\n')
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    config = load_toml_with_env_vars(str(config_path))
+    assert config["model_client"]["base_url"] == "http://example.com"
+
+
+def test_load_toml_returns_independent_copies(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        '[model_client]\nstop = ["a", "b"]\n\n[[agents]]\nname = "planner"\n'
+    )
+
+    config = load_toml_with_env_vars(str(config_path))
+    config["model_client"]["stop"].append("c")
+    config["agents"][0]["name"] = "changed"
+
+    config = load_toml_with_env_vars(str(config_path))
+    assert config["model_client"]["stop"] == ["a", "b"]
+    assert config["agents"][0]["name"] == "planner"
@@ -0,0 +1,24 @@
+from autogen_core.models import ModelFamily
+
+from Sagi.utils.model_client import ModelClientFactory
+
+CLIENT_CONFIG = {
+    "model": "gpt-4o-mini",
+    "base_url": "http://localhost:8000/v1",
+    "api_key": "test-key",
+    "max_tokens": 1024,
+    "model_info": {
+        "vision": False,
+        "function_calling": True,
+        "json_output": True,
+        "structured_output": True,
+    },
+}
+
+
+def test_model_info_family_is_unknown():
+    model_info = ModelClientFactory._init_model_info(CLIENT_CONFIG)
+    assert model_info["family"] == ModelFamily.UNKNOWN
+    assert model_info["function_calling"] is True
+    # The caller's config must not be mutated
+    assert "family" not in CLIENT_CONFIG["model_info"]